@@ -6,7 +6,8 @@
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any, Tuple, Union
+from decimal import Decimal
 from enum import Enum
 import logging
 
@@ -267,13 +268,13 @@ class BaseExchangeAdapter(ABC):
             f"{self.__class__.__name__} 必须实现 fetch_funding_balance"
         )
 
-    async def transfer_to_funding(self, asset: str, amount: float) -> bool:
+    async def transfer_to_funding(self, asset: str, amount: Union[Decimal, float]) -> bool:
         """
         转账到理财账户（可选功能）
 
         Args:
             asset: 资产名称
-            amount: 转账数量
+            amount: 转账数量（建议传 Decimal，float 会在边界转换）
 
         Returns:
             是否成功
@@ -288,13 +289,13 @@ class BaseExchangeAdapter(ABC):
             f"{self.__class__.__name__} 必须实现 transfer_to_funding"
         )
 
-    async def transfer_to_spot(self, asset: str, amount: float) -> bool:
+    async def transfer_to_spot(self, asset: str, amount: Union[Decimal, float]) -> bool:
         """
         从理财账户转回现货（可选功能）
 
         Args:
             asset: 资产名称
-            amount: 转账数量
+            amount: 转账数量（建议传 Decimal，float 会在边界转换）
 
         Returns:
             是否成功
@@ -7,18 +7,33 @@
 - 账户划转
 """
 
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any, Tuple, Union
+from decimal import Decimal
+import asyncio
 import time
-import ccxt.async_support as ccxt
+import uuid
+import aiohttp
+import ccxt.pro as ccxtpro
+
+# orjson 为可选加速依赖 (优雅降级)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
 from src.core.exchange.base import (
     BaseExchangeAdapter,
     ExchangeType,
     ExchangeFeature,
     ExchangeCapabilities
 )
+from src.core.exchanges._alpha_mixin import AlphaTradingMixin
+from src.core.exchange.ticker_bus import TickerBus
 
 
-class BinanceAdapter(BaseExchangeAdapter):
+class BinanceAdapter(AlphaTradingMixin, BaseExchangeAdapter):
     """
     币安交易所适配器
 
@@ -28,6 +43,61 @@ class BinanceAdapter(BaseExchangeAdapter):
     - ✅ 账户划转
     """
 
+    # 全量行情缓存有效期（秒）：窗口内的并发调用合并为一次 fetch_tickers
+    TICKERS_CACHE_TTL = 2.0
+
+    # Alpha 交易所信息后台刷新间隔（秒）：略小于 Mixin 的缓存 TTL，
+    # 保证下单路径读到的缓存始终是热的
+    ALPHA_INFO_REFRESH_INTERVAL = 25
+
+    # 批量下单/撤单的最大并发数（币安现货没有批量接口，逐单并发提交）
+    ORDER_BATCH_CONCURRENCY = 5
+
+    # K线并发扇出的最大在途请求数（尊重币安 1200 weight/min 预算）
+    OHLCV_CONCURRENCY = 10
+
+    # K线缓存有效期（秒），按周期分级：已收盘的K线在周期内不会变化，
+    # 活跃K线的时滞由 TTL 上界控制
+    OHLCV_CACHE_TTLS = {'1m': 15, '1h': 60, '1d': 600}
+    OHLCV_CACHE_DEFAULT_TTL = 60
+
+    # 服务器时钟偏移的后台刷新间隔（秒）
+    TIME_SYNC_INTERVAL = 300
+
+    # 订单簿快照最大容忍时龄（秒）：超过则丢弃并等待推送重建
+    ORDER_BOOK_MAX_AGE = 10.0
+
+    # 冷启动/重建时等待有效订单簿快照的最大推送次数
+    ORDER_BOOK_INIT_RETRIES = 3
+
+    def __init__(self, api_key: str, api_secret: str, **kwargs):
+        super().__init__(api_key, api_secret, **kwargs)
+
+        # 本地与服务器时钟偏移（毫秒），由后台任务定期刷新
+        self.time_diff = 0
+
+        # WebSocket 推送缓存：行情/订单簿由常驻 watch 任务增量维护，
+        # 读取时直接返回内存快照，避免每次调用一个 REST 往返
+        self._ticker_cache: Dict[str, Dict[str, Any]] = {}
+        self._order_book_cache: Dict[str, Dict[str, Any]] = {}
+        self._order_book_seen: Dict[str, float] = {}
+        self._watch_tasks: Dict[str, asyncio.Task] = {}
+
+        # 全量行情合并缓存：扫描多个交易对时共享一次 fetch_tickers 响应
+        self._tickers_cache: Dict[str, Any] = {'timestamp': 0, 'data': {}}
+        self._tickers_lock = asyncio.Lock()
+
+        # K线缓存：同一评估周期内多个指标共享一份K线数据
+        self._ohlcv_cache: Dict[Tuple[str, str, int], Tuple[float, List[List]]] = {}
+
+        # 共享的 aiohttp 会话（initialize 中创建，close 中关闭）
+        self._session: Optional[aiohttp.ClientSession] = None
+
+        # 跨进程行情总线（可选）：同机多进程部署时由 ticker_bus_role
+        # 指定角色，ingester 进程写入共享内存，consumer 进程本地读取
+        self._ticker_bus_role: Optional[str] = kwargs.get('ticker_bus_role')
+        self._ticker_bus: Optional[TickerBus] = None
+
     @property
     def exchange_type(self) -> ExchangeType:
         return ExchangeType.BINANCE
@@ -44,18 +114,38 @@ class BinanceAdapter(BaseExchangeAdapter):
         """初始化币安连接"""
         self.logger.info("正在初始化币安交易所连接...")
 
-        self._alpha_exchange_cache = None
+        # 预热的 HTTP 连接池：放大并发上限、缓存 DNS、延长 keep-alive，
+        # 让 REST 调用复用已有 TLS 会话而不是每次重新握手
+        connector = aiohttp.TCPConnector(
+            limit=100,
+            ttl_dns_cache=300,
+            keepalive_timeout=75,
+        )
+        self._session = aiohttp.ClientSession(connector=connector)
 
-        self._exchange = ccxt.binance({
+        self._exchange = ccxtpro.binance({
             'apiKey': self.api_key,
             'secret': self.api_secret,
             'enableRateLimit': True,
+            'session': self._session,
+            'aiohttp_trust_env': True,
             'options': {
                 'defaultType': 'spot',
                 'adjustForTimeDifference': True,
             }
         })
 
+        # orjson 是 C 实现的 JSON 解析器，大报文（全量行情、交易所信息）
+        # 解析快 3-5 倍；未安装时保持 ccxt 默认的标准 json
+        if ORJSON_AVAILABLE:
+            self._exchange.on_json_response = orjson.loads
+            self._exchange.json = lambda data, params=None: orjson.dumps(data).decode()
+        else:
+            self.logger.debug("未安装 orjson，使用标准 json 解析")
+
+        # 绑定 Alpha 固定端点（Mixin 提供，每个端点只绑定一次）
+        self._bind_alpha_endpoints(self._exchange)
+
         # 加载市场数据
         await self._exchange.load_markets()
 
@@ -63,14 +153,39 @@ class BinanceAdapter(BaseExchangeAdapter):
         balance = await self._exchange.fetch_balance()
         self.logger.info(
             f"✅ 币安连接成功 | "
-            f"账户资产: {len([k for k, v in balance['free'].items() if float(v) > 0])} 种"
+            f"账户资产: {sum(1 for v in balance['free'].values() if v and float(v) > 0)} 种"
         )
 
+        # 首次同步服务器时钟偏移，之后由后台任务定期刷新
+        await self._sync_time_once()
+        self._watch_tasks['time_sync'] = asyncio.create_task(self._sync_time_loop())
+
+        # 后台预热 Alpha 交易所信息缓存，让下单路径省掉一个 REST 往返
+        self._watch_tasks['alpha_info'] = asyncio.create_task(
+            self._refresh_alpha_info_loop()
+        )
+
+        # 可选的跨进程行情总线：consumer 挂载失败（ingester 未启动）
+        # 时降级为自行获取行情，不影响单进程部署
+        if self._ticker_bus_role:
+            try:
+                self._ticker_bus = TickerBus(role=self._ticker_bus_role)
+                self.logger.info(f"行情总线已启用，角色: {self._ticker_bus_role}")
+            except FileNotFoundError:
+                self.logger.warning("行情总线不存在（ingester 未启动），回退自行获取行情")
+
     async def close(self) -> None:
         """关闭连接"""
+        for task in getattr(self, '_watch_tasks', {}).values():
+            task.cancel()
         if self._exchange:
             await self._exchange.close()
             self.logger.info("币安连接已关闭")
+        # 自建的会话由自己负责关闭（ccxt 不会关闭外部传入的 session）
+        if self._session and not self._session.closed:
+            await self._session.close()
+        if self._ticker_bus is not None:
+            self._ticker_bus.close()
 
     # ==================== 核心交易接口实现 ====================
 
@@ -79,12 +194,73 @@ class BinanceAdapter(BaseExchangeAdapter):
         return await self._exchange.fetch_balance({'type': account_type})
 
     async def fetch_ticker(self, symbol: str) -> Dict[str, Any]:
-        """获取行情"""
-        return await self._exchange.fetch_ticker(symbol)
+        """获取行情（WebSocket 推送缓存，首次调用等待一次推送）"""
+        # consumer 进程优先读共享内存总线，完全不发出站请求；
+        # 总线中无此符号或数据过期时走自己的 WebSocket 路径
+        if self._ticker_bus is not None and self._ticker_bus.role == 'consumer':
+            frame = self._ticker_bus.get(symbol)
+            if frame is not None:
+                return {'symbol': symbol, **frame}
+
+        self._ensure_watch_task(f'ticker:{symbol}', self._ticker_loop, symbol)
+
+        cached = self._ticker_cache.get(symbol)
+        if cached is not None:
+            return cached
+
+        # WebSocket 快照尚未就绪：优先读全量行情合并缓存，
+        # 避免扫描白名单时每个交易对各发一次 REST 请求
+        ticker = (await self.fetch_tickers_bulk()).get(symbol)
+        if ticker is not None:
+            return ticker
+
+        ticker = await self._exchange.watch_ticker(symbol)
+        self._ticker_cache[symbol] = ticker
+        return ticker
+
+    async def fetch_tickers_bulk(self) -> Dict[str, Any]:
+        """获取全量行情字典（TTL 窗口内合并为一次 fetch_tickers 调用）"""
+        async with self._tickers_lock:
+            now = time.time()
+            if now - self._tickers_cache['timestamp'] > self.TICKERS_CACHE_TTL:
+                self._tickers_cache = {
+                    'timestamp': now,
+                    'data': await self._exchange.fetch_tickers(),
+                }
+        return self._tickers_cache['data']
 
     async def fetch_order_book(self, symbol: str, limit: int = 5) -> Dict[str, Any]:
-        """获取订单簿"""
-        return await self._exchange.fetch_order_book(symbol, limit)
+        """获取订单簿（WebSocket 快照+增量维护，读取内存快照）"""
+        self._ensure_watch_task(f'order_book:{symbol}', self._order_book_loop, symbol)
+
+        cached = self._order_book_cache.get(symbol)
+        if cached is not None and (
+            time.time() - self._order_book_seen.get(symbol, 0) > self.ORDER_BOOK_MAX_AGE
+        ):
+            # 推送长时间未更新（断流/序列号错位后的静默期）：
+            # 丢弃旧快照，强制等一次新的推送重建订单簿
+            self.logger.warning(f"订单簿快照过期，触发重建: {symbol}")
+            self._order_book_cache.pop(symbol, None)
+            cached = None
+
+        if cached is None:
+            # 与 _order_book_loop 共用同一校验：交叉/空盘口不入缓存，
+            # 继续等下一次推送，连续无效才向调用方报错
+            for _ in range(self.ORDER_BOOK_INIT_RETRIES):
+                book = await self._exchange.watch_order_book(symbol)
+                if self._is_valid_order_book(book):
+                    cached = book
+                    self._order_book_cache[symbol] = book
+                    self._order_book_seen[symbol] = time.time()
+                    break
+                self.logger.warning(f"订单簿快照无效（交叉盘口），等待下一次推送: {symbol}")
+            if cached is None:
+                raise ValueError(f"连续收到无效订单簿快照: {symbol}")
+
+        snapshot = dict(cached)
+        snapshot['bids'] = list(cached['bids'])[:limit]
+        snapshot['asks'] = list(cached['asks'])[:limit]
+        return snapshot
 
     async def create_order(
         self,
@@ -95,19 +271,82 @@ class BinanceAdapter(BaseExchangeAdapter):
         price: Optional[float] = None,
         params: Optional[Dict] = None
     ) -> Dict[str, Any]:
-        """创建订单"""
+        """创建订单（优先走 WebSocket Trade API）"""
+        # 幂等重试保护：WS 超时时订单可能已被币安受理，直接重发会挂出
+        # 重复订单；两次尝试共用同一个 clientOrderId，真正的重复提交
+        # 会被服务端按重复单拒绝，而不是成交两次
+        params = dict(params or {})
+        params.setdefault('clientOrderId', f'grid-{uuid.uuid4().hex[:24]}')
         # 币安特定：amount必须是字符串格式（CCXT会自动处理）
-        return await self._exchange.create_order(
+        return await self._ws_trade_call(
+            'create_order_ws', 'create_order',
             symbol, order_type, side, amount, price, params
         )
 
     async def cancel_order(self, order_id: str, symbol: str) -> Dict[str, Any]:
-        """取消订单"""
-        return await self._exchange.cancel_order(order_id, symbol)
+        """取消订单（优先走 WebSocket Trade API）"""
+        return await self._ws_trade_call(
+            'cancel_order_ws', 'cancel_order', order_id, symbol
+        )
 
     async def fetch_order(self, order_id: str, symbol: str) -> Dict[str, Any]:
-        """查询订单"""
-        return await self._exchange.fetch_order(order_id, symbol)
+        """查询订单（优先走 WebSocket Trade API）"""
+        return await self._ws_trade_call(
+            'fetch_order_ws', 'fetch_order', order_id, symbol
+        )
+
+    async def _ws_trade_call(self, ws_method: str, rest_method: str, *args) -> Dict[str, Any]:
+        """通过 WebSocket Trade API 执行订单操作，连接异常时回退 REST
+
+        订单请求走长连接的 ws-api 通道，省掉每次 REST 调用的
+        TCP+TLS 往返；业务类错误（余额不足、参数非法等）原样抛出，
+        只有连接层面的失败才换用 REST 重发。
+
+        注意超时语义：RequestTimeout 也是 NetworkError 的子类，而超时
+        的请求可能已被交易所受理。create_order 通过两次尝试共用同一个
+        clientOrderId 保证重发幂等；cancel/fetch 本身幂等，重发无害。
+        """
+        try:
+            return await getattr(self._exchange, ws_method)(*args)
+        except (ccxtpro.NetworkError, ccxtpro.NotSupported) as exc:
+            self.logger.warning(f"WebSocket {ws_method} 失败，回退 REST: {exc}")
+            return await getattr(self._exchange, rest_method)(*args)
+
+    async def create_orders_batch(self, orders: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """批量创建订单：有界并发逐单提交
+
+        币安现货没有批量下单接口（批量端点仅限合约），多单无法合并
+        为一次请求；这里复用 fetch_ohlcv_many 的信号量模式并发扇出，
+        把 N 次串行往返压缩为约 N/并发度 个往返周期。任一订单失败
+        原样抛出，其余在途订单照常完成。
+
+        Args:
+            orders: 订单描述列表，每项与 create_order 参数同构:
+                {'symbol', 'type', 'side', 'amount', 'price', 'params'}
+
+        Returns:
+            与输入顺序一致的订单信息列表
+        """
+        semaphore = asyncio.Semaphore(self.ORDER_BATCH_CONCURRENCY)
+
+        async def place_one(order: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.create_order(
+                    order['symbol'], order['type'], order['side'],
+                    order['amount'], order.get('price'), order.get('params'),
+                )
+
+        return list(await asyncio.gather(*[place_one(o) for o in orders]))
+
+    async def cancel_orders_batch(self, order_ids: List[str], symbol: str) -> List[Dict[str, Any]]:
+        """批量取消订单：有界并发逐单撤销（现货同样没有批量撤单接口）"""
+        semaphore = asyncio.Semaphore(self.ORDER_BATCH_CONCURRENCY)
+
+        async def cancel_one(order_id: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.cancel_order(order_id, symbol)
+
+        return list(await asyncio.gather(*[cancel_one(oid) for oid in order_ids]))
 
     async def fetch_open_orders(self, symbol: Optional[str] = None) -> List[Dict[str, Any]]:
         """获取未成交订单"""
@@ -123,8 +362,151 @@ class BinanceAdapter(BaseExchangeAdapter):
         timeframe: str = '1h',
         limit: int = 100
     ) -> List[List]:
-        """获取K线数据"""
-        return await self._exchange.fetch_ohlcv(symbol, timeframe, limit=limit)
+        """获取K线数据（按周期 TTL 缓存，同一评估周期内复用）"""
+        key = (symbol, timeframe, limit)
+        cached = self._ohlcv_cache.get(key)
+        ttl = self.OHLCV_CACHE_TTLS.get(timeframe, self.OHLCV_CACHE_DEFAULT_TTL)
+        now = time.time()
+        if cached and now - cached[0] < ttl:
+            return cached[1]
+
+        ohlcv = await self._exchange.fetch_ohlcv(symbol, timeframe, limit=limit)
+        self._ohlcv_cache[key] = (now, ohlcv)
+        return ohlcv
+
+    async def fetch_ohlcv_many(
+        self,
+        symbols: List[str],
+        timeframe: str = '1h',
+        limit: int = 100
+    ) -> Dict[str, List[List]]:
+        """并发获取多个交易对的K线数据
+
+        币安没有批量K线接口，逐个串行请求是 N 次往返；这里并发
+        扇出，并用信号量限制同时在途的请求数，避免触发限频。
+        单个交易对失败不影响其余结果，只记录告警并跳过。
+
+        Returns:
+            {symbol: K线数组} 映射，失败的交易对不在结果中
+        """
+        semaphore = asyncio.Semaphore(self.OHLCV_CONCURRENCY)
+
+        async def fetch_one(symbol: str) -> List[List]:
+            async with semaphore:
+                return await self.fetch_ohlcv(symbol, timeframe, limit)
+
+        results = await asyncio.gather(
+            *[fetch_one(s) for s in symbols], return_exceptions=True
+        )
+
+        ohlcv_map: Dict[str, List[List]] = {}
+        for symbol, result in zip(symbols, results):
+            if isinstance(result, Exception):
+                self.logger.warning(f"获取K线失败 {symbol}: {result}")
+            else:
+                ohlcv_map[symbol] = result
+        return ohlcv_map
+
+    async def find_listing_date(self, symbol: str) -> int:
+        """二分探测交易对的上市时间（毫秒时间戳）
+
+        历史回填若从固定早点逐天扫描，会在上市前的空白区浪费大量
+        限频额度；对日线K线是否存在做二分，约 14 次探测即可把上市
+        日定位到一天以内。
+
+        Returns:
+            上市日前最后一个无数据的毫秒时间戳（误差一天以内）
+        """
+        day_ms = 86_400_000
+        # 币安 2017 年中才上线，以 2017-01-01 为探测下界
+        lo = 1483228800000
+        hi = self._now_ms()
+
+        while hi - lo > day_ms:
+            mid = (lo + hi) // 2
+            data = await self._exchange.fetch_ohlcv(symbol, '1d', since=mid, limit=1)
+            if data:
+                hi = mid
+            else:
+                lo = mid
+
+        return lo
+
+    # ==================== 时间同步 ====================
+    # _now_ms 由 AlphaTradingMixin 提供（叠加缓存的时钟偏移）
+
+    async def _sync_time_once(self) -> None:
+        """同步一次服务器时钟偏移"""
+        server_time = await self._exchange.fetch_time()
+        self.time_diff = server_time - int(time.time() * 1000)
+        self.logger.debug(f"时间同步完成，偏移: {self.time_diff}ms")
+
+    async def _sync_time_loop(self) -> None:
+        """常驻任务：定期刷新服务器时钟偏移"""
+        while True:
+            await asyncio.sleep(self.TIME_SYNC_INTERVAL)
+            try:
+                await self._sync_time_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                self.logger.warning(f"时间同步失败: {exc}")
+
+    # ==================== WebSocket 推送维护 ====================
+
+    def _ensure_watch_task(self, key: str, loop_fn, symbol: str) -> None:
+        """确保指定的 watch 任务正在运行（惰性启动，按交易对一个任务）"""
+        task = self._watch_tasks.get(key)
+        if task is None or task.done():
+            self._watch_tasks[key] = asyncio.create_task(loop_fn(symbol))
+
+    async def _ticker_loop(self, symbol: str) -> None:
+        """常驻任务：通过 watch_ticker 持续刷新行情快照"""
+        while True:
+            try:
+                ticker = await self._exchange.watch_ticker(symbol)
+                self._ticker_cache[symbol] = ticker
+                if self._ticker_bus is not None and self._ticker_bus.role == 'ingester':
+                    self._ticker_bus.publish(
+                        symbol,
+                        ticker.get('bid'),
+                        ticker.get('ask'),
+                        ticker.get('last'),
+                        ticker.get('timestamp'),
+                    )
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                self.logger.warning(f"行情推送中断 {symbol}，1秒后重试: {exc}")
+                await asyncio.sleep(1)
+
+    async def _order_book_loop(self, symbol: str) -> None:
+        """常驻任务：通过 watch_order_book 维护订单簿快照
+
+        CCXT Pro 内部先取 REST 快照再应用增量（数量为0的档位自动删除），
+        这里只做基本有效性校验：买一价必须低于卖一价。
+        """
+        while True:
+            try:
+                order_book = await self._exchange.watch_order_book(symbol)
+                if self._is_valid_order_book(order_book):
+                    self._order_book_cache[symbol] = order_book
+                    self._order_book_seen[symbol] = time.time()
+                else:
+                    self.logger.warning(f"订单簿快照无效（交叉盘口），丢弃: {symbol}")
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                self.logger.warning(f"订单簿推送中断 {symbol}，1秒后重试: {exc}")
+                await asyncio.sleep(1)
+
+    @staticmethod
+    def _is_valid_order_book(order_book: Dict[str, Any]) -> bool:
+        bids = order_book.get('bids') or []
+        asks = order_book.get('asks') or []
+        if bids and asks:
+            return asks[0][0] > bids[0][0]
+        return bool(bids or asks)
 
     # ==================== 精度处理 ====================
 
@@ -141,144 +523,44 @@ class BinanceAdapter(BaseExchangeAdapter):
         return await self._exchange.load_markets(reload)
 
     # ==================== Alpha 2.0 流动性接口 ====================
+    # 查询/下单/缓存逻辑由 AlphaTradingMixin 提供，与 BinanceExchange 共享
 
     async def fetch_funding_balance(self) -> Dict[str, float]:
         """获取 Alpha 2.0 钱包余额"""
         try:
-            params = {
-                'timestamp': self._exchange.milliseconds(),
-                'recvWindow': 5000,
-            }
-            response = await self._exchange.request(
-                'v1/asset/get-alpha-asset', 'sapi', 'GET', params
-            )
-
-            balances: Dict[str, float] = {}
-            for item in response:
-                code = item.get('cexAssetCode') or item.get('alphaId')
-                if not code:
-                    continue
-                amount = float(item.get('amount', 0) or 0)
-                if amount > 0:
-                    balances[code] = amount
-
-            return balances
+            return await self._fetch_alpha_assets()
         except Exception as exc:
             self.logger.error(f"获取 Alpha 资产余额失败: {exc}")
             return {}
 
-    async def transfer_to_funding(self, asset: str, amount: float) -> bool:
+    async def transfer_to_funding(self, asset: str, amount: Union[Decimal, float]) -> bool:
         """通过 Alpha 2.0 下单将资金转入流动性"""
         try:
-            base_asset, quote_asset, price, quantity = await self._build_alpha_order(
-                asset, amount
-            )
-
-            params = {
-                'baseAsset': base_asset,
-                'quoteAsset': quote_asset,
-                'side': 'BUY',
-                'quantity': quantity,
-                'price': price,
-                'timestamp': self._exchange.milliseconds(),
-                'recvWindow': 5000,
-            }
-
-            await self._exchange.request(
-                'v1/alpha-trade/order/place', 'sapi', 'POST', params
-            )
+            await self._place_alpha_order('BUY', asset, amount)
             return True
         except Exception as exc:
             self.logger.error(f"Alpha 下单失败（BUY）: {exc}")
             return False
 
-    async def transfer_to_spot(self, asset: str, amount: float) -> bool:
+    async def transfer_to_spot(self, asset: str, amount: Union[Decimal, float]) -> bool:
         """通过 Alpha 2.0 下单将资金转回现货"""
         try:
-            base_asset, quote_asset, price, quantity = await self._build_alpha_order(
-                asset, amount
-            )
-
-            params = {
-                'baseAsset': base_asset,
-                'quoteAsset': quote_asset,
-                'side': 'SELL',
-                'quantity': quantity,
-                'price': price,
-                'timestamp': self._exchange.milliseconds(),
-                'recvWindow': 5000,
-            }
-
-            await self._exchange.request(
-                'v1/alpha-trade/order/place', 'sapi', 'POST', params
-            )
+            await self._place_alpha_order('SELL', asset, amount)
             return True
         except Exception as exc:
             self.logger.error(f"Alpha 下单失败（SELL）: {exc}")
             return False
 
-    async def get_alpha_exchange_info(self) -> Dict[str, Any]:
-        """获取 Alpha 交易所信息"""
-        cache = getattr(self, '_alpha_exchange_cache', None)
-        now = time.time()
-        if cache and now - cache[0] < 30:
-            return cache[1]
-
-        params = {
-            'timestamp': self._exchange.milliseconds(),
-            'recvWindow': 5000,
-        }
-        info = await self._exchange.request(
-            'v1/alpha-trade/get-exchange-info', 'sapi', 'GET', params
-        )
-        self._alpha_exchange_cache = (now, info)
-        return info
-
-    async def get_alpha_ticker_price(self, symbol: str) -> float:
-        """获取 Alpha 交易对的最新价格"""
-        params = {
-            'symbol': symbol,
-            'timestamp': self._exchange.milliseconds(),
-            'recvWindow': 5000,
-        }
-        ticker = await self._exchange.request(
-            'v1/alpha-trade/market/ticker-price', 'sapi', 'GET', params
-        )
-        return float(ticker.get('price', 0) or 0)
-
-    async def _build_alpha_order(self, quote_asset: str, amount: float) -> Tuple[str, str, str, str]:
-        """根据报价资产和金额构建 Alpha 下单信息"""
-        exchange_info = await self.get_alpha_exchange_info()
-        symbols = exchange_info.get('symbols', [])
-        symbol_info = next(
-            (
-                s for s in symbols
-                if s.get('quoteAsset') == quote_asset and s.get('status') == 'TRADING'
-            ),
-            None,
-        )
-
-        if not symbol_info:
-            raise ValueError(f"未找到可交易的 Alpha 交易对（quote={quote_asset}）")
-
-        symbol_name = symbol_info['symbol']
-        price_value = await self.get_alpha_ticker_price(symbol_name)
-        if price_value <= 0:
-            raise ValueError(f"Alpha 交易对 {symbol_name} 缺少有效价格")
-
-        quantity_value = amount / price_value
-        price = self._format_with_precision(
-            price_value, symbol_info.get('pricePrecision', 8)
-        )
-        quantity = self._format_with_precision(
-            quantity_value, symbol_info.get('quantityPrecision', 8)
-        )
-
-        return symbol_info['baseAsset'], quote_asset, price, quantity
-
-    @staticmethod
-    def _format_with_precision(value: float, precision: int) -> str:
-        return format(value, f'.{precision}f')
+    async def _refresh_alpha_info_loop(self) -> None:
+        """常驻任务：定期刷新 Alpha 交易所信息共享缓存，保证缓存常热"""
+        while True:
+            try:
+                await self.refresh_alpha_exchange_info()
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                self.logger.warning(f"刷新 Alpha 交易所信息失败: {exc}")
+            await asyncio.sleep(self.ALPHA_INFO_REFRESH_INTERVAL)
 
     # ==================== 币安特定工具方法 ====================
 
@@ -7,7 +7,8 @@ OKX交易所适配器
 - 账户划转
 """
 
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Union
+from decimal import Decimal
 import ccxt.async_support as ccxt
 from src.core.exchange.base import (
     BaseExchangeAdapter,
@@ -138,7 +139,7 @@ class OKXAdapter(BaseExchangeAdapter):
         """获取未成交订单"""
         return await self._exchange.fetch_open_orders(symbol)
 
-    async def fetch_my_trades(self, symbol: str, limit: int = 50) -> List[Dict[str, Any]:
+    async def fetch_my_trades(self, symbol: str, limit: int = 50) -> List[Dict[str, Any]]:
         """获取成交历史"""
         return await self._exchange.fetch_my_trades(symbol, limit=limit)
 
@@ -196,7 +197,7 @@ class OKXAdapter(BaseExchangeAdapter):
             # OKX可能不支持或API有变化，返回空字典
             return {}
 
-    async def transfer_to_funding(self, asset: str, amount: float) -> bool:
+    async def transfer_to_funding(self, asset: str, amount: Union[Decimal, float]) -> bool:
         """
         申购OKX余币宝
 
@@ -229,7 +230,7 @@ class OKXAdapter(BaseExchangeAdapter):
             self.logger.error(f"申购OKX余币宝失败: {e}")
             return False
 
-    async def transfer_to_spot(self, asset: str, amount: float) -> bool:
+    async def transfer_to_spot(self, asset: str, amount: Union[Decimal, float]) -> bool:
         """
         从OKX余币宝赎回到交易账户
 
@@ -0,0 +1,147 @@
+"""
+共享内存行情总线
+
+同一台机器上跑多个机器人进程时，每个进程各自订阅/轮询行情，
+带宽与限频额度按进程数成倍消耗。行情总线把行情获取收敛到一个
+摄入进程（ingester）：它把归一化的行情写入共享内存环
+（``multiprocessing.shared_memory``），其余进程（consumer）本地
+读取，M 个进程 × N 个交易对的出站请求坍缩为 N 个。
+
+存储布局为定宽结构体数组，每槽 40 字节::
+
+    symbol_hash: uint64 | bid: float64 | ask: float64 | last: float64 | ts_ms: int64
+
+槽位按符号哈希线性探测分配，哈希字段一经写入不再改写，因此
+读者不会串键；同一符号两次更新之间的读到的 bid/ask 可能来自
+相邻两帧，对轮询式网格策略无影响。
+"""
+
+from typing import Dict, Optional
+from multiprocessing import shared_memory
+import hashlib
+import struct
+import time
+
+
+class TickerBus:
+    """基于共享内存的单写多读行情总线
+
+    角色：
+    - ``ingester``: 创建共享内存段并写入行情（每台机器仅一个）
+    - ``consumer``: 挂载已存在的段并只读
+
+    总线不存在时 consumer 构造会抛 ``FileNotFoundError``，
+    调用方据此回退到自行获取行情。
+    """
+
+    # 槽结构: 符号哈希 / 买一 / 卖一 / 最新价 / 毫秒时间戳
+    SLOT = struct.Struct('<Qdddq')
+
+    DEFAULT_NAME = 'bn_grid_ticker_bus'
+    DEFAULT_CAPACITY = 256
+
+    # 超过该时龄（秒）的槽视为过期，读取返回 None
+    DEFAULT_MAX_AGE = 5.0
+
+    def __init__(
+        self,
+        role: str,
+        name: str = DEFAULT_NAME,
+        capacity: int = DEFAULT_CAPACITY,
+    ):
+        if role not in ('ingester', 'consumer'):
+            raise ValueError(f"未知的行情总线角色: {role}")
+
+        self.role = role
+        self.name = name
+        self.capacity = capacity
+        # 符号 -> 槽位索引的本地记忆，命中后免去线性探测
+        self._slot_of: Dict[str, int] = {}
+
+        if role == 'ingester':
+            try:
+                self._shm = shared_memory.SharedMemory(
+                    name=name, create=True, size=capacity * self.SLOT.size
+                )
+            except FileExistsError:
+                # 上次未正常清理的残段：直接复用（哈希字段幂等）
+                self._shm = shared_memory.SharedMemory(name=name)
+        else:
+            self._shm = shared_memory.SharedMemory(name=name)
+
+    # ==================== 槽位定位 ====================
+
+    @staticmethod
+    def _hash(symbol: str) -> int:
+        """符号的 64 位稳定哈希（0 保留为空槽标记）"""
+        digest = hashlib.blake2b(symbol.encode(), digest_size=8).digest()
+        return int.from_bytes(digest, 'little') or 1
+
+    def _find_slot(self, symbol: str, claim: bool) -> Optional[int]:
+        """线性探测定位符号槽位；claim=True 时允许占用首个空槽"""
+        cached = self._slot_of.get(symbol)
+        if cached is not None:
+            return cached
+
+        symbol_hash = self._hash(symbol)
+        start = symbol_hash % self.capacity
+        for step in range(self.capacity):
+            index = (start + step) % self.capacity
+            offset = index * self.SLOT.size
+            stored = struct.unpack_from('<Q', self._shm.buf, offset)[0]
+            if stored == symbol_hash:
+                self._slot_of[symbol] = index
+                return index
+            if stored == 0:
+                if not claim:
+                    return None
+                self._slot_of[symbol] = index
+                return index
+        if claim:
+            raise RuntimeError(
+                f"行情总线槽位已满 (capacity={self.capacity})，无法写入 {symbol}"
+            )
+        return None
+
+    # ==================== 读写接口 ====================
+
+    def publish(
+        self,
+        symbol: str,
+        bid: float,
+        ask: float,
+        last: float,
+        timestamp_ms: Optional[int] = None,
+    ) -> None:
+        """写入一帧行情（仅 ingester 调用）"""
+        index = self._find_slot(symbol, claim=True)
+        if timestamp_ms is None:
+            timestamp_ms = int(time.time() * 1000)
+        self.SLOT.pack_into(
+            self._shm.buf, index * self.SLOT.size,
+            self._hash(symbol), bid or 0.0, ask or 0.0, last or 0.0, timestamp_ms,
+        )
+
+    def get(self, symbol: str, max_age: float = DEFAULT_MAX_AGE) -> Optional[Dict[str, float]]:
+        """读取符号的最新行情，未写入或超过 max_age 秒返回 None"""
+        index = self._find_slot(symbol, claim=False)
+        if index is None:
+            return None
+
+        _, bid, ask, last, ts_ms = self.SLOT.unpack_from(
+            self._shm.buf, index * self.SLOT.size
+        )
+        if time.time() * 1000 - ts_ms > max_age * 1000:
+            return None
+        return {'bid': bid, 'ask': ask, 'last': last, 'timestamp': ts_ms}
+
+    # ==================== 生命周期 ====================
+
+    def close(self) -> None:
+        """解除本进程的映射（ingester 同时销毁共享内存段）"""
+        self._shm.close()
+        if self.role == 'ingester':
+            try:
+                self._shm.unlink()
+            except FileNotFoundError:
+                pass
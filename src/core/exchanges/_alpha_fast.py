@@ -0,0 +1,42 @@
+"""
+Alpha 热路径纯函数（可编译加速）
+
+下单路径上每单都会调用的精度格式化与符号索引被抽成本模块的
+全类型标注纯函数，便于用 mypyc 编译为 C 扩展::
+
+    python -m mypyc src/core/exchanges/_alpha_fast.py
+
+未编译时以普通 Python 模块运行，行为完全一致；编译产物存在时
+import 机制会自动优先加载 C 扩展。
+"""
+
+from typing import Dict, Any, Final, Tuple, Union
+from decimal import Decimal, ROUND_DOWN
+
+# 预生成的量化指数：无需每次重建 Decimal(10) ** -p
+_EXPONENTS: Final[Tuple[Decimal, ...]] = tuple(Decimal(10) ** -i for i in range(17))
+
+
+def format_with_precision(value: Union[Decimal, float], precision: int) -> str:
+    """按指定小数位向下取整格式化数值（币安参数要求字符串形式）
+
+    用 Decimal.quantize(ROUND_DOWN) 而非 float 的 format 舍入：
+    float 的四舍五入可能把数量抬过 LOT_SIZE 上限，被交易所拒单后
+    白白多付一次重试往返。
+    """
+    if not isinstance(value, Decimal):
+        value = Decimal(str(value))
+    if 0 <= precision < len(_EXPONENTS):
+        exponent = _EXPONENTS[precision]
+    else:
+        exponent = Decimal(10) ** -precision
+    return format(value.quantize(exponent, rounding=ROUND_DOWN), 'f')
+
+
+def index_alpha_symbols(info: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """按报价资产索引可交易的 Alpha 交易对，下单路径 O(1) 查找"""
+    index: Dict[str, Dict[str, Any]] = {}
+    for s in info.get('symbols', []):
+        if s.get('quoteAsset') and s.get('status') == 'TRADING':
+            index[s['quoteAsset']] = s
+    return index
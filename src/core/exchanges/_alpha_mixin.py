@@ -0,0 +1,234 @@
+"""
+币安 Alpha 2.0 共享实现
+
+`BinanceAdapter`（exchange/ 适配器层）与 `BinanceExchange`（exchanges/
+实现层）此前各自维护一套几乎相同的 Alpha 查询与下单逻辑：重复的
+交易所信息缓存、重复的价格查询和精度格式化，改一处漏一处。
+
+该 Mixin 把这部分收敛为一份。交易所信息缓存是类级的：两层适配器
+共享同一份缓存，任何一方刷新都同时为另一方预热，避免重复的
+出站请求。
+"""
+
+from typing import Dict, Optional, Any, Tuple, Union
+from collections import defaultdict
+from decimal import Decimal
+import asyncio
+import functools
+import hashlib
+import json
+import time
+
+from cachetools import TTLCache
+
+# orjson 为可选加速依赖 (优雅降级)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+from src.core.exchanges._alpha_fast import format_with_precision, index_alpha_symbols
+
+
+class AlphaTradingMixin:
+    """币安 Alpha 2.0 流动性共享逻辑
+
+    宿主类需要：
+    - 在 ccxt 实例创建后调用 :meth:`_bind_alpha_endpoints`
+    - 提供 ``time_diff``（本地与服务器时钟偏移，毫秒）和 ``logger``
+    """
+
+    # Alpha 交易所信息缓存有效期（秒）
+    ALPHA_INFO_CACHE_TTL = 30
+
+    # Alpha 价格缓存：突发的同币种转账在 TTL 窗口内合并为一次请求
+    ALPHA_PRICE_CACHE_SIZE = 256
+    ALPHA_PRICE_CACHE_TTL = 2.0
+
+    # Alpha 请求参数原型：调用时复制并补上时间戳，不逐键重建
+    _ALPHA_PARAMS_PROTO = {'recvWindow': 5000}
+
+    # 类级缓存 (时间戳, 原始信息, 报价资产索引, 内容签名)：两层适配器共享
+    _alpha_exchange_cache: Optional[
+        Tuple[float, Dict[str, Any], Dict[str, Dict[str, Any]], bytes]
+    ] = None
+
+    # ==================== 绑定与参数构造 ====================
+
+    def _bind_alpha_endpoints(self, client) -> None:
+        """绑定 ccxt 实例与固定 Alpha 端点（每个端点只绑定一次）"""
+        self._alpha_client = client
+        self._req_alpha_assets = functools.partial(
+            client.request, 'v1/asset/get-alpha-asset', 'sapi', 'GET'
+        )
+        self._req_alpha_info = functools.partial(
+            client.request, 'v1/alpha-trade/get-exchange-info', 'sapi', 'GET'
+        )
+        self._req_alpha_ticker = functools.partial(
+            client.request, 'v1/alpha-trade/market/ticker-price', 'sapi', 'GET'
+        )
+        self._req_alpha_place = functools.partial(
+            client.request, 'v1/alpha-trade/order/place', 'sapi', 'POST'
+        )
+        self._alpha_price_cache = TTLCache(
+            self.ALPHA_PRICE_CACHE_SIZE, self.ALPHA_PRICE_CACHE_TTL
+        )
+        self._alpha_price_locks = defaultdict(asyncio.Lock)
+
+    def _now_ms(self) -> int:
+        """当前毫秒时间戳（叠加缓存的服务器时钟偏移，无网络往返）"""
+        return int(time.time() * 1000 + getattr(self, 'time_diff', 0))
+
+    def _alpha_params(self, **extra: Any) -> Dict[str, Any]:
+        """构造带签名时间戳的请求参数（复制原型而非逐键重建）"""
+        params = self._ALPHA_PARAMS_PROTO.copy()
+        params['timestamp'] = self._now_ms()
+        if extra:
+            params.update(extra)
+        return params
+
+    # ==================== 交易所信息缓存 ====================
+
+    async def get_alpha_exchange_info(self) -> Dict[str, Any]:
+        """获取 Alpha 交易所信息（共享缓存未过期时直接返回）"""
+        cache = AlphaTradingMixin._alpha_exchange_cache
+        if cache and time.time() - cache[0] < self.ALPHA_INFO_CACHE_TTL:
+            return cache[1]
+        return await self.refresh_alpha_exchange_info()
+
+    async def refresh_alpha_exchange_info(self) -> Dict[str, Any]:
+        """强制刷新共享缓存（后台预热任务直接调用）
+
+        条件替换：符号列表极少变化，刷新时先比较内容签名，
+        未变化只续期时间戳并保留已建好的索引对象，省去重建
+        索引的 CPU，也让持有旧索引引用的读者继续有效。
+        """
+        info = await self._req_alpha_info(self._alpha_params())
+        sig = self._alpha_info_signature(info)
+
+        cache = AlphaTradingMixin._alpha_exchange_cache
+        if cache is not None and cache[3] == sig:
+            AlphaTradingMixin._alpha_exchange_cache = (
+                time.time(), cache[1], cache[2], sig
+            )
+            return cache[1]
+
+        AlphaTradingMixin._alpha_exchange_cache = (
+            time.time(), info, self._index_alpha_symbols(info), sig
+        )
+        return info
+
+    @staticmethod
+    def _alpha_info_signature(info: Dict[str, Any]) -> bytes:
+        """符号列表的 8 字节内容签名（orjson 缺失时回退标准 json）"""
+        symbols = info.get('symbols', [])
+        if ORJSON_AVAILABLE:
+            payload = orjson.dumps(symbols, option=orjson.OPT_SORT_KEYS)
+        else:
+            payload = json.dumps(symbols, sort_keys=True).encode()
+        return hashlib.blake2b(payload, digest_size=8).digest()
+
+    # 热路径纯函数来自 _alpha_fast（可用 mypyc 编译为 C 扩展）
+    _index_alpha_symbols = staticmethod(index_alpha_symbols)
+    _format_with_precision = staticmethod(format_with_precision)
+
+    async def _get_alpha_symbol_info(self, quote_asset: str) -> Dict[str, Any]:
+        """查找报价资产对应的可交易 Alpha 交易对"""
+        cache = AlphaTradingMixin._alpha_exchange_cache
+        if not (cache and time.time() - cache[0] < self.ALPHA_INFO_CACHE_TTL):
+            await self.get_alpha_exchange_info()
+            cache = AlphaTradingMixin._alpha_exchange_cache
+
+        symbol_info = cache[2].get(quote_asset)
+        if not symbol_info:
+            raise ValueError(f"未找到报价资产为 {quote_asset} 的 Alpha 交易对")
+        return symbol_info
+
+    # ==================== 查询与下单 ====================
+
+    async def get_alpha_ticker_price(self, symbol: str) -> float:
+        """获取 Alpha 交易对的最新价格（短 TTL 缓存 + 按币种合并并发请求）
+
+        双重检查锁：先无锁读缓存，未命中时按币种加锁，拿锁后再查
+        一次——并发的 N 个同币种调用只有第一个真正发请求。
+        """
+        price = self._alpha_price_cache.get(symbol)
+        if price is not None:
+            return price
+
+        async with self._alpha_price_locks[symbol]:
+            price = self._alpha_price_cache.get(symbol)
+            if price is not None:
+                return price
+
+            ticker = await self._req_alpha_ticker(self._alpha_params(symbol=symbol))
+            price = float(ticker.get('price', 0) or 0)
+            # 无效价格不入缓存：缓存 0 会让后续调用在整个 TTL 窗口内
+            # 直接命中坏值失败，一次瞬时坏报文不应阻塞 2 秒内的转账
+            if price > 0:
+                self._alpha_price_cache[symbol] = price
+            return price
+
+    async def _fetch_alpha_assets(self) -> Dict[str, float]:
+        """获取 Alpha 钱包余额，返回 {资产: 数量>0} 映射"""
+        response = await self._req_alpha_assets(self._alpha_params())
+
+        balances: Dict[str, float] = {}
+        for item in response:
+            code = item.get('cexAssetCode') or item.get('alphaId')
+            if not code:
+                continue
+            amount = float(item.get('amount', 0) or 0)
+            if amount > 0:
+                balances[code] = amount
+        return balances
+
+    async def _build_alpha_order(
+        self, quote_asset: str, amount: Union[Decimal, float]
+    ) -> Tuple[str, str, str, str]:
+        """根据报价资产和金额构建 Alpha 下单信息
+
+        金额在边界立即转为 Decimal，数量计算与精度截断全程精确，
+        避免 float 舍入把数量抬过精度/步长限制被交易所拒单。
+        共享缓存由任意一层适配器的刷新保持常热，常规路径只需等待
+        一次价格查询。
+        """
+        if not isinstance(amount, Decimal):
+            amount = Decimal(str(amount))
+
+        symbol_info = await self._get_alpha_symbol_info(quote_asset)
+
+        symbol_name = symbol_info['symbol']
+        price_value = await self.get_alpha_ticker_price(symbol_name)
+        if price_value <= 0:
+            raise ValueError(f"Alpha 交易对 {symbol_name} 缺少有效价格")
+
+        quantity_value = amount / Decimal(str(price_value))
+        price = self._format_with_precision(
+            price_value, symbol_info.get('pricePrecision', 8)
+        )
+        quantity = self._format_with_precision(
+            quantity_value, symbol_info.get('quantityPrecision', 8)
+        )
+
+        return symbol_info['baseAsset'], quote_asset, price, quantity
+
+    async def _place_alpha_order(
+        self, side: str, quote_asset: str, amount: Union[Decimal, float]
+    ) -> Any:
+        """构建并提交一笔 Alpha BUY/SELL 订单，返回交易所原始响应"""
+        base_asset, quote, price, quantity = await self._build_alpha_order(
+            quote_asset, amount
+        )
+        self.logger.info(
+            f"Alpha {side}: {quantity} {base_asset} @ {price} ({quote})"
+        )
+        return await self._req_alpha_place(self._alpha_params(
+            baseAsset=base_asset,
+            quoteAsset=quote,
+            side=side,
+            quantity=quantity,
+            price=price,
+        ))
@@ -15,6 +15,7 @@
 from abc import ABC, abstractmethod
 from typing import Optional, Dict, List, Any, Union
 from dataclasses import dataclass
+from decimal import Decimal
 from enum import Enum
 import logging
 import time
@@ -35,6 +36,21 @@ class ExchangeCapabilities(Enum):
     WEBSOCKET = "websocket"                 # WebSocket支持
 
 
+# ============================================================================
+# 缓存数据结构
+# ============================================================================
+
+@dataclass(slots=True)
+class BalanceCache:
+    """余额缓存条目
+
+    固定槽位的属性访问替代字典的逐键哈希查找，多个交易对共享
+    同一实例时减少每次命中的开销。
+    """
+    timestamp: float = 0.0
+    data: Optional[dict] = None
+
+
 # ============================================================================
 # 核心接口定义
 # ============================================================================
@@ -177,13 +193,13 @@ class ISavingsFeature(ABC):
         pass
 
     @abstractmethod
-    async def transfer_to_savings(self, asset: str, amount: float) -> dict:
+    async def transfer_to_savings(self, asset: str, amount: Union[Decimal, float]) -> dict:
         """
         从现货账户申购理财
 
         Args:
             asset: 资产名称
-            amount: 申购金额
+            amount: 申购金额（建议传 Decimal，float 会在边界转换）
 
         Returns:
             dict: 操作结果
@@ -191,13 +207,13 @@ class ISavingsFeature(ABC):
         pass
 
     @abstractmethod
-    async def transfer_to_spot(self, asset: str, amount: float) -> dict:
+    async def transfer_to_spot(self, asset: str, amount: Union[Decimal, float]) -> dict:
         """
         从理财账户赎回到现货
 
         Args:
             asset: 资产名称
-            amount: 赎回金额
+            amount: 赎回金额（建议传 Decimal，float 会在边界转换）
 
         Returns:
             dict: 操作结果
@@ -309,9 +325,11 @@ class BaseExchange(IExchange):
         # 状态变量
         self.markets_loaded = False
         self.time_diff = 0  # 本地时间与服务器时间差（毫秒）
+        self.time_sync_interval = 300  # 时钟偏移刷新间隔（秒）
+        self._last_time_sync = 0.0
 
         # 缓存
-        self.balance_cache = {'timestamp': 0, 'data': None}
+        self.balance_cache = BalanceCache()
         self.cache_ttl = 30  # 缓存有效期（秒）
 
         # 初始化CCXT实例（延迟到子类实现）
@@ -420,8 +438,9 @@ class BaseExchange(IExchange):
         5. 标准化输出
         """
         try:
-            # 1. 同步时间
-            await self.sync_time()
+            # 1. 时钟偏移过期才重新同步，避免每单都付一次 RTT
+            if time.time() - self._last_time_sync > self.time_sync_interval:
+                await self.sync_time()
 
             # 2. 调整精度
             adjusted_amount = self.adjust_amount_precision(symbol, amount)
@@ -483,8 +502,8 @@ class BaseExchange(IExchange):
     async def fetch_balance(self, params: Optional[dict] = None) -> dict:
         """获取余额（带缓存）"""
         now = time.time()
-        if now - self.balance_cache['timestamp'] < self.cache_ttl:
-            return self.balance_cache['data']
+        if now - self.balance_cache.timestamp < self.cache_ttl:
+            return self.balance_cache.data
 
         try:
             params = params or {}
@@ -492,7 +511,7 @@ class BaseExchange(IExchange):
 
             balance = await self.exchange.fetch_balance(params)
 
-            self.balance_cache = {'timestamp': now, 'data': balance}
+            self.balance_cache = BalanceCache(now, balance)
             return balance
         except Exception as e:
             self.logger.error(f"获取余额失败: {e}")
@@ -542,6 +561,7 @@ class BaseExchange(IExchange):
             server_time = await self.exchange.fetch_time()
             local_time = int(time.time() * 1000)
             self.time_diff = server_time - local_time
+            self._last_time_sync = time.time()
             self.logger.debug(f"时间同步完成，时差: {self.time_diff}ms")
         except Exception as e:
             self.logger.error(f"时间同步失败: {e}")
@@ -13,22 +13,25 @@
 
 import ccxt.async_support as ccxt
 import time
-from typing import Dict, Optional
+from typing import Dict, Union
+from decimal import Decimal
 from src.core.exchanges.base import (
     BaseExchange,
+    BalanceCache,
     ISavingsFeature,
     ExchangeCapabilities
 )
+from src.core.exchanges._alpha_mixin import AlphaTradingMixin
 from src.core.exchanges.factory import ExchangeConfig
 
 
-class BinanceExchange(BaseExchange, ISavingsFeature):
+class BinanceExchange(AlphaTradingMixin, BaseExchange, ISavingsFeature):
     """
     币安交易所实现
 
     特性：
     - 完整的现货交易支持
-    - Alpha 2.0 流动性操作
+    - Alpha 2.0 流动性操作（共享 AlphaTradingMixin 实现）
     - 灵活的精度处理
     - 自动时间同步
     """
@@ -44,8 +47,10 @@ class BinanceExchange(BaseExchange, ISavingsFeature):
         super().__init__('binance', config)
 
         # 理财余额缓存
-        self.funding_balance_cache = {'timestamp': 0, 'data': {}}
-        self._alpha_exchange_cache = None
+        self.funding_balance_cache = BalanceCache(data={})
+
+        # 绑定 Alpha 固定端点（Mixin 提供，每个端点只绑定一次）
+        self._bind_alpha_endpoints(self.exchange)
 
         self.logger.info("币安交易所初始化完成")
 
@@ -81,6 +86,7 @@ class BinanceExchange(BaseExchange, ISavingsFeature):
 
     # ========================================================================
     # 理财功能实现 (ISavingsFeature)
+    # 查询/下单/缓存逻辑由 AlphaTradingMixin 提供，与 BinanceAdapter 共享
     # ========================================================================
 
     async def fetch_funding_balance(self) -> Dict[str, float]:
@@ -89,69 +95,26 @@ class BinanceExchange(BaseExchange, ISavingsFeature):
             return {}
 
         now = time.time()
-        if now - self.funding_balance_cache['timestamp'] < self.cache_ttl:
-            return self.funding_balance_cache['data']
+        if now - self.funding_balance_cache.timestamp < self.cache_ttl:
+            return self.funding_balance_cache.data
 
         try:
-            params = {
-                'timestamp': int(time.time() * 1000 + self.time_diff),
-                'recvWindow': 5000,
-            }
-            result = await self.exchange.request(
-                'v1/asset/get-alpha-asset', 'sapi', 'GET', params
-            )
-
-            balances: Dict[str, float] = {}
-            for item in result:
-                asset_code = item.get('cexAssetCode') or item.get('alphaId')
-                if not asset_code:
-                    continue
-                amount = float(item.get('amount', 0) or 0)
-                if amount > 0:
-                    balances[asset_code] = amount
-
-            self.funding_balance_cache = {'timestamp': now, 'data': balances}
+            balances = await self._fetch_alpha_assets()
+
+            self.funding_balance_cache = BalanceCache(now, balances)
             self.logger.debug(f"Alpha 余额: {balances}")
             return balances
         except Exception as exc:
             self.logger.error(f"获取 Alpha 余额失败: {exc}")
-            return self.funding_balance_cache.get('data', {})
+            return self.funding_balance_cache.data or {}
 
-    async def transfer_to_savings(self, asset: str, amount: float) -> dict:
+    async def transfer_to_savings(self, asset: str, amount: Union[Decimal, float]) -> dict:
         """通过 Alpha 2.0 买入资产以提供流动性"""
         if not self.config.enable_savings:
             raise RuntimeError("理财功能未启用")
 
         try:
-            symbol_info = await self._get_alpha_symbol_info(asset)
-            price_value = await self._get_alpha_ticker_price(symbol_info['symbol'])
-            if price_value <= 0:
-                raise ValueError(f"Alpha 交易对 {symbol_info['symbol']} 缺少有效价格")
-
-            quantity_value = amount / price_value
-            quantity = self._format_alpha_value(
-                quantity_value, symbol_info.get('quantityPrecision', 8)
-            )
-            price = self._format_alpha_value(
-                price_value, symbol_info.get('pricePrecision', 8)
-            )
-
-            params = {
-                'baseAsset': symbol_info['baseAsset'],
-                'quoteAsset': asset,
-                'side': 'BUY',
-                'quantity': quantity,
-                'price': price,
-                'timestamp': int(time.time() * 1000 + self.time_diff),
-                'recvWindow': 5000,
-            }
-
-            self.logger.info(
-                f"Alpha 买入: {quantity} {symbol_info['baseAsset']} @ {price} ({asset})"
-            )
-            result = await self.exchange.request(
-                'v1/alpha-trade/order/place', 'sapi', 'POST', params
-            )
+            result = await self._place_alpha_order('BUY', asset, amount)
 
             self._clear_balance_cache()
 
@@ -161,41 +124,13 @@ class BinanceExchange(BaseExchange, ISavingsFeature):
             self.logger.error(f"Alpha 买入失败: {exc}")
             raise
 
-    async def transfer_to_spot(self, asset: str, amount: float) -> dict:
+    async def transfer_to_spot(self, asset: str, amount: Union[Decimal, float]) -> dict:
         """通过 Alpha 2.0 卖出资产回收流动性"""
         if not self.config.enable_savings:
             raise RuntimeError("理财功能未启用")
 
         try:
-            symbol_info = await self._get_alpha_symbol_info(asset)
-            price_value = await self._get_alpha_ticker_price(symbol_info['symbol'])
-            if price_value <= 0:
-                raise ValueError(f"Alpha 交易对 {symbol_info['symbol']} 缺少有效价格")
-
-            quantity_value = amount / price_value
-            quantity = self._format_alpha_value(
-                quantity_value, symbol_info.get('quantityPrecision', 8)
-            )
-            price = self._format_alpha_value(
-                price_value, symbol_info.get('pricePrecision', 8)
-            )
-
-            params = {
-                'baseAsset': symbol_info['baseAsset'],
-                'quoteAsset': asset,
-                'side': 'SELL',
-                'quantity': quantity,
-                'price': price,
-                'timestamp': int(time.time() * 1000 + self.time_diff),
-                'recvWindow': 5000,
-            }
-
-            self.logger.info(
-                f"Alpha 卖出: {quantity} {symbol_info['baseAsset']} @ {price} ({asset})"
-            )
-            result = await self.exchange.request(
-                'v1/alpha-trade/order/place', 'sapi', 'POST', params
-            )
+            result = await self._place_alpha_order('SELL', asset, amount)
 
             self._clear_balance_cache()
 
@@ -209,43 +144,7 @@ class BinanceExchange(BaseExchange, ISavingsFeature):
     # 币安特定辅助方法
     # ========================================================================
 
-    async def _get_alpha_symbol_info(self, quote_asset: str) -> Dict[str, Any]:
-        cache = self._alpha_exchange_cache
-        now = time.time()
-        if cache and now - cache[0] < 30:
-            exchange_info = cache[1]
-        else:
-            params = {
-                'timestamp': int(time.time() * 1000 + self.time_diff),
-                'recvWindow': 5000,
-            }
-            exchange_info = await self.exchange.request(
-                'v1/alpha-trade/get-exchange-info', 'sapi', 'GET', params
-            )
-            self._alpha_exchange_cache = (now, exchange_info)
-
-        for symbol in exchange_info.get('symbols', []):
-            if symbol.get('quoteAsset') == quote_asset and symbol.get('status') == 'TRADING':
-                return symbol
-
-        raise ValueError(f"未找到报价资产为 {quote_asset} 的 Alpha 交易对")
-
-    async def _get_alpha_ticker_price(self, symbol: str) -> float:
-        params = {
-            'symbol': symbol,
-            'timestamp': int(time.time() * 1000 + self.time_diff),
-            'recvWindow': 5000,
-        }
-        ticker = await self.exchange.request(
-            'v1/alpha-trade/market/ticker-price', 'sapi', 'GET', params
-        )
-        return float(ticker.get('price', 0) or 0)
-
-    @staticmethod
-    def _format_alpha_value(value: float, precision: int) -> str:
-        return format(value, f'.{precision}f')
-
     def _clear_balance_cache(self):
         """清除余额缓存"""
-        self.balance_cache = {'timestamp': 0, 'data': None}
-        self.funding_balance_cache = {'timestamp': 0, 'data': {}}
+        self.balance_cache = BalanceCache()
+        self.funding_balance_cache = BalanceCache(data={})
@@ -14,9 +14,11 @@ OKX交易所实现
 import ccxt.async_support as ccxt
 import time
 import uuid
-from typing import Dict, Optional
+from typing import Dict, Optional, Union
+from decimal import Decimal
 from src.core.exchanges.base import (
     BaseExchange,
+    BalanceCache,
     ISavingsFeature,
     ExchangeCapabilities
 )
@@ -50,7 +52,7 @@ class OKXExchange(BaseExchange, ISavingsFeature):
         super().__init__('okx', config)
 
         # OKX理财余额缓存
-        self.funding_balance_cache = {'timestamp': 0, 'data': {}}
+        self.funding_balance_cache = BalanceCache(data={})
 
         self.logger.info("OKX交易所初始化完成")
 
@@ -92,8 +94,8 @@ class OKXExchange(BaseExchange, ISavingsFeature):
         now = time.time()
 
         # 缓存检查
-        if now - self.funding_balance_cache['timestamp'] < self.cache_ttl:
-            return self.funding_balance_cache['data']
+        if now - self.funding_balance_cache.timestamp < self.cache_ttl:
+            return self.funding_balance_cache.data
 
         try:
             # 获取资金账户余额
@@ -110,19 +112,16 @@ class OKXExchange(BaseExchange, ISavingsFeature):
                         balances[asset] = amount
 
             # 更新缓存
-            self.funding_balance_cache = {
-                'timestamp': now,
-                'data': balances
-            }
+            self.funding_balance_cache = BalanceCache(now, balances)
 
             self.logger.debug(f"资金账户余额: {balances}")
             return balances
 
         except Exception as e:
             self.logger.error(f"获取资金账户余额失败: {e}")
-            return self.funding_balance_cache.get('data', {})
+            return self.funding_balance_cache.data or {}
 
-    async def transfer_to_savings(self, asset: str, amount: float) -> dict:
+    async def transfer_to_savings(self, asset: str, amount: Union[Decimal, float]) -> dict:
         """
         从交易账户转入资金账户（OKX的理财需要先转入资金账户）
 
@@ -163,7 +162,7 @@ class OKXExchange(BaseExchange, ISavingsFeature):
             self.logger.error(f"转入资金账户失败: {e}")
             raise
 
-    async def transfer_to_spot(self, asset: str, amount: float) -> dict:
+    async def transfer_to_spot(self, asset: str, amount: Union[Decimal, float]) -> dict:
         """
         从资金账户转回交易账户
 
@@ -209,8 +208,8 @@ class OKXExchange(BaseExchange, ISavingsFeature):
 
     def _clear_balance_cache(self):
         """清除余额缓存"""
-        self.balance_cache = {'timestamp': 0, 'data': None}
-        self.funding_balance_cache = {'timestamp': 0, 'data': {}}
+        self.balance_cache = BalanceCache()
+        self.funding_balance_cache = BalanceCache(data={})
 
     async def get_account_balance(self, account_type: str = 'spot') -> dict:
         """
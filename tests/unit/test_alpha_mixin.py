@@ -0,0 +1,147 @@
+"""
+Alpha 共享 Mixin 单元测试
+
+重点覆盖类级交易所信息缓存的条件替换语义。
+"""
+
+import logging
+from decimal import Decimal
+from unittest.mock import Mock, AsyncMock
+
+import pytest
+
+from src.core.exchanges._alpha_fast import format_with_precision
+from src.core.exchanges._alpha_mixin import AlphaTradingMixin
+
+
+class _Host(AlphaTradingMixin):
+    """最小宿主：只提供 Mixin 依赖的 logger 与时钟偏移"""
+
+    def __init__(self, client):
+        self.logger = logging.getLogger('test_alpha_mixin')
+        self.time_diff = 0
+        self._bind_alpha_endpoints(client)
+
+
+def _make_host(info):
+    client = Mock()
+    client.request = AsyncMock(return_value=info)
+    return _Host(client), client
+
+
+_INFO_V1 = {
+    'symbols': [
+        {
+            'symbol': 'ALPHA_1USDT',
+            'baseAsset': 'ALPHA_1',
+            'quoteAsset': 'USDT',
+            'status': 'TRADING',
+        }
+    ]
+}
+
+_INFO_V2 = {
+    'symbols': [
+        {
+            'symbol': 'ALPHA_2USDT',
+            'baseAsset': 'ALPHA_2',
+            'quoteAsset': 'USDT',
+            'status': 'TRADING',
+        }
+    ]
+}
+
+
+class TestFormatWithPrecision:
+    """测试下单参数的精度格式化"""
+
+    def test_truncates_instead_of_rounding(self):
+        """向下截断而非四舍五入，数量不会被舍入抬过步长上限"""
+        assert format_with_precision(0.119999, 2) == '0.11'
+
+    def test_accepts_decimal(self):
+        """Decimal 输入直接量化，不经过 float"""
+        assert format_with_precision(Decimal('1.23456789'), 4) == '1.2345'
+
+    def test_pads_trailing_zeros(self):
+        """不足指定位数时补零（交易所要求定宽字符串）"""
+        assert format_with_precision(Decimal('600.15'), 8) == '600.15000000'
+
+    def test_zero_precision(self):
+        """precision=0 时输出整数部分"""
+        assert format_with_precision(7.9, 0) == '7'
+
+
+class TestAlphaPriceCache:
+    """测试 Alpha 价格短 TTL 缓存"""
+
+    @pytest.mark.asyncio
+    async def test_valid_price_cached(self):
+        """TTL 窗口内重复查询同一符号只发一次请求"""
+        client = Mock()
+        client.request = AsyncMock(return_value={'price': '2.5'})
+        host = _Host(client)
+
+        assert await host.get_alpha_ticker_price('ALPHA_1USDT') == 2.5
+        assert await host.get_alpha_ticker_price('ALPHA_1USDT') == 2.5
+        assert client.request.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_invalid_price_not_cached(self):
+        """无效价格不入缓存，下一次调用立即重查"""
+        client = Mock()
+        client.request = AsyncMock(side_effect=[{'price': '0'}, {'price': '2.5'}])
+        host = _Host(client)
+
+        assert await host.get_alpha_ticker_price('ALPHA_1USDT') == 0.0
+        assert await host.get_alpha_ticker_price('ALPHA_1USDT') == 2.5
+        assert client.request.call_count == 2
+
+
+class TestConditionalRefresh:
+    """测试交易所信息缓存的条件替换"""
+
+    def setup_method(self):
+        """每个测试前清空类级共享缓存"""
+        AlphaTradingMixin._alpha_exchange_cache = None
+
+    @pytest.mark.asyncio
+    async def test_unchanged_refresh_keeps_index_object(self):
+        """内容未变时只续期时间戳，索引对象原样保留"""
+        host, _ = _make_host(_INFO_V1)
+
+        await host.refresh_alpha_exchange_info()
+        first_ts, _, first_index, first_sig = AlphaTradingMixin._alpha_exchange_cache
+
+        await host.refresh_alpha_exchange_info()
+        second_ts, _, second_index, second_sig = AlphaTradingMixin._alpha_exchange_cache
+
+        assert second_index is first_index
+        assert second_sig == first_sig
+        assert second_ts >= first_ts
+
+    @pytest.mark.asyncio
+    async def test_changed_refresh_rebuilds_index(self):
+        """内容变化时替换缓存并重建索引"""
+        host, client = _make_host(_INFO_V1)
+        await host.refresh_alpha_exchange_info()
+
+        client.request = AsyncMock(return_value=_INFO_V2)
+        host._bind_alpha_endpoints(client)
+        info = await host.refresh_alpha_exchange_info()
+
+        assert info == _INFO_V2
+        _, _, index, _ = AlphaTradingMixin._alpha_exchange_cache
+        assert index['USDT']['symbol'] == 'ALPHA_2USDT'
+
+    @pytest.mark.asyncio
+    async def test_cache_shared_across_hosts(self):
+        """一个宿主的刷新为另一个宿主预热缓存"""
+        host_a, _ = _make_host(_INFO_V1)
+        host_b, client_b = _make_host(_INFO_V1)
+
+        await host_a.refresh_alpha_exchange_info()
+        info = await host_b.get_alpha_exchange_info()
+
+        assert info == _INFO_V1
+        client_b.request.assert_not_called()
@@ -103,7 +103,7 @@ class TestBinanceAdapter:
     @pytest.mark.asyncio
     async def test_initialize(self):
         """测试初始化"""
-        with patch('ccxt.async_support.binance') as mock_ccxt:
+        with patch('ccxt.pro.binance') as mock_ccxt:
             mock_exchange = AsyncMock()
             mock_exchange.load_markets = AsyncMock(return_value={})
             mock_exchange.fetch_balance = AsyncMock(return_value={'free': {}})
@@ -114,6 +114,124 @@ class TestBinanceAdapter:
             assert self.adapter._exchange is not None
             mock_exchange.load_markets.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_create_order_retry_reuses_client_order_id(self):
+        """测试 WS 超时回退 REST 时两次尝试共用同一个 clientOrderId"""
+        import ccxt
+
+        self.adapter._exchange = AsyncMock()
+        self.adapter._exchange.create_order_ws = AsyncMock(
+            side_effect=ccxt.RequestTimeout('timed out')
+        )
+        self.adapter._exchange.create_order = AsyncMock(return_value={'id': '1'})
+
+        await self.adapter.create_order('BNB/USDT', 'limit', 'buy', 1.0, 600.0)
+
+        ws_params = self.adapter._exchange.create_order_ws.call_args[0][5]
+        rest_params = self.adapter._exchange.create_order.call_args[0][5]
+        assert ws_params['clientOrderId']
+        # 重发携带相同的 clientOrderId，服务端按重复单去重
+        assert ws_params['clientOrderId'] == rest_params['clientOrderId']
+
+    @pytest.mark.asyncio
+    async def test_create_order_keeps_caller_client_order_id(self):
+        """测试调用方自带的 clientOrderId 不被覆盖"""
+        self.adapter._exchange = AsyncMock()
+        self.adapter._exchange.create_order_ws = AsyncMock(return_value={'id': '1'})
+
+        await self.adapter.create_order(
+            'BNB/USDT', 'limit', 'buy', 1.0, 600.0,
+            params={'clientOrderId': 'caller-id'}
+        )
+
+        ws_params = self.adapter._exchange.create_order_ws.call_args[0][5]
+        assert ws_params['clientOrderId'] == 'caller-id'
+
+    @pytest.mark.asyncio
+    async def test_create_orders_batch_fanout(self):
+        """测试批量下单并发逐单提交且保持输入顺序"""
+        self.adapter._exchange = AsyncMock()
+
+        async def fake_create_order_ws(symbol, order_type, side, amount, price, params):
+            return {'id': symbol, 'price': price}
+
+        self.adapter._exchange.create_order_ws = AsyncMock(
+            side_effect=fake_create_order_ws
+        )
+
+        orders = [{'symbol': f'COIN{i}/USDT', 'type': 'limit', 'side': 'buy',
+                   'amount': 0.001, 'price': float(i)} for i in range(7)]
+        results = await self.adapter.create_orders_batch(orders)
+
+        # 现货没有批量接口：逐单提交，结果与输入顺序一致
+        assert self.adapter._exchange.create_order_ws.call_count == 7
+        assert [r['id'] for r in results] == [o['symbol'] for o in orders]
+
+    @pytest.mark.asyncio
+    async def test_cancel_orders_batch_fanout(self):
+        """测试批量撤单并发逐单撤销"""
+        self.adapter._exchange = AsyncMock()
+        self.adapter._exchange.cancel_order_ws = AsyncMock(
+            side_effect=lambda order_id, symbol: {'id': order_id}
+        )
+
+        results = await self.adapter.cancel_orders_batch(['1', '2', '3'], 'BNB/USDT')
+
+        assert self.adapter._exchange.cancel_order_ws.call_count == 3
+        assert [r['id'] for r in results] == ['1', '2', '3']
+
+    @pytest.mark.asyncio
+    async def test_fetch_order_book_rejects_crossed_snapshot(self):
+        """测试冷启动路径丢弃交叉盘口快照，等到有效推送才入缓存"""
+        crossed = {'bids': [[101.0, 1.0]], 'asks': [[100.0, 1.0]]}
+        valid = {'bids': [[99.0, 1.0]], 'asks': [[100.0, 1.0]]}
+
+        self.adapter._exchange = AsyncMock()
+        self.adapter._exchange.watch_order_book = AsyncMock(
+            side_effect=[crossed, valid]
+        )
+
+        # 只验证冷启动路径，不让常驻 watch 任务消费 mock 推送
+        with patch.object(self.adapter, '_ensure_watch_task'):
+            snapshot = await self.adapter.fetch_order_book('BNB/USDT')
+
+        assert snapshot['asks'][0][0] == 100.0
+        assert snapshot['bids'][0][0] == 99.0
+        # 交叉盘口不得进入缓存
+        assert self.adapter._order_book_cache['BNB/USDT'] is valid
+
+    @pytest.mark.asyncio
+    async def test_fetch_order_book_raises_after_repeated_invalid(self):
+        """测试连续无效快照向调用方报错而不是返回坏数据"""
+        crossed = {'bids': [[101.0, 1.0]], 'asks': [[100.0, 1.0]]}
+
+        self.adapter._exchange = AsyncMock()
+        self.adapter._exchange.watch_order_book = AsyncMock(return_value=crossed)
+
+        with patch.object(self.adapter, '_ensure_watch_task'):
+            with pytest.raises(ValueError, match="无效订单簿快照"):
+                await self.adapter.fetch_order_book('BNB/USDT')
+        assert 'BNB/USDT' not in self.adapter._order_book_cache
+
+    @pytest.mark.asyncio
+    async def test_fetch_ohlcv_many_skips_failures(self):
+        """测试并发K线获取：单个失败不影响其余交易对"""
+        candles = [[1, 2.0, 3.0, 1.0, 2.5, 100.0]]
+
+        async def fake_fetch_ohlcv(symbol, timeframe, limit=100):
+            if symbol == 'BAD/USDT':
+                raise RuntimeError("boom")
+            return candles
+
+        self.adapter._exchange = AsyncMock()
+        self.adapter._exchange.fetch_ohlcv = AsyncMock(side_effect=fake_fetch_ohlcv)
+
+        result = await self.adapter.fetch_ohlcv_many(
+            ['BTC/USDT', 'BAD/USDT', 'ETH/USDT']
+        )
+
+        assert result == {'BTC/USDT': candles, 'ETH/USDT': candles}
+
     def test_amount_precision(self):
         """测试数量精度调整"""
         # Mock CCXT exchange
@@ -0,0 +1,82 @@
+"""
+共享内存行情总线单元测试
+
+ingester 与 consumer 在同一进程内挂载同一段共享内存即可验证
+读写语义，无需真正跨进程。
+"""
+
+import os
+import time
+
+import pytest
+
+from src.core.exchange.ticker_bus import TickerBus
+
+
+@pytest.fixture
+def bus_name():
+    """每个测试独立的共享内存段名，避免并行测试互相污染"""
+    return f"tb_test_{os.getpid()}_{time.monotonic_ns()}"
+
+
+@pytest.fixture
+def ingester(bus_name):
+    bus = TickerBus(role='ingester', name=bus_name, capacity=8)
+    yield bus
+    bus.close()
+
+
+class TestTickerBus:
+    """测试行情总线读写语义"""
+
+    def test_publish_and_get(self, ingester, bus_name):
+        """consumer 读到 ingester 写入的行情帧"""
+        ingester.publish('BNB/USDT', bid=600.1, ask=600.2, last=600.15)
+
+        consumer = TickerBus(role='consumer', name=bus_name, capacity=8)
+        try:
+            frame = consumer.get('BNB/USDT')
+            assert frame is not None
+            assert frame['bid'] == 600.1
+            assert frame['ask'] == 600.2
+            assert frame['last'] == 600.15
+        finally:
+            consumer.close()
+
+    def test_unknown_symbol_returns_none(self, ingester):
+        """未写入过的符号读取返回 None"""
+        assert ingester.get('ETH/USDT') is None
+
+    def test_stale_frame_returns_none(self, ingester):
+        """超过 max_age 的行情帧视为过期"""
+        stale_ts = int(time.time() * 1000) - 10_000
+        ingester.publish('BNB/USDT', 600.1, 600.2, 600.15, timestamp_ms=stale_ts)
+
+        assert ingester.get('BNB/USDT', max_age=5.0) is None
+        assert ingester.get('BNB/USDT', max_age=60.0) is not None
+
+    def test_update_overwrites_slot(self, ingester):
+        """同一符号重复写入覆盖原槽位而非占用新槽"""
+        ingester.publish('BNB/USDT', 600.0, 600.1, 600.05)
+        ingester.publish('BNB/USDT', 601.0, 601.1, 601.05)
+
+        frame = ingester.get('BNB/USDT')
+        assert frame['bid'] == 601.0
+
+    def test_capacity_exhaustion_raises(self, ingester):
+        """槽位满后继续写入新符号抛出异常"""
+        for i in range(8):
+            ingester.publish(f'COIN{i}/USDT', 1.0, 1.1, 1.05)
+
+        with pytest.raises(RuntimeError, match="槽位已满"):
+            ingester.publish('ONE_MORE/USDT', 1.0, 1.1, 1.05)
+
+    def test_consumer_requires_existing_bus(self, bus_name):
+        """ingester 未启动时 consumer 构造抛 FileNotFoundError"""
+        with pytest.raises(FileNotFoundError):
+            TickerBus(role='consumer', name=bus_name)
+
+    def test_invalid_role_rejected(self, bus_name):
+        """未知角色直接拒绝"""
+        with pytest.raises(ValueError, match="角色"):
+            TickerBus(role='publisher', name=bus_name)